@@ -1,88 +1,176 @@
 import asyncio
 import functools
+import inspect
 from typing import Callable, Any, Coroutine, Optional, Tuple, Dict, TypeVar
 
 T = TypeVar('T')
 
-def throttle(wait: float):
+# Deadline used while a trailing call is queued, it is reset on dispatch
+_QUEUED = float("inf")
+
+class _State:
+    """Mutable per-function throttle state, accessed as plain attributes."""
+
+    __slots__ = ("args", "kwargs", "future", "deadline", "loop")
+
+    def __init__(self):
+        # Pending trailing-edge call, future is None when nothing is queued
+        self.args: Tuple = ()
+        self.kwargs: Optional[Dict[str, Any]] = None
+        self.future: Optional[asyncio.Future] = None
+        # Earliest loop time at which a call may run immediately
+        self.deadline = 0.0
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _copy_outcome(future: asyncio.Future, task: asyncio.Future) -> None:
+    """Done callback that copies the outcome of task onto future."""
+    if task.cancelled():
+        future.cancel()
+        return
+    # Always retrieve the exception, even if nobody is waiting for it anymore,
+    # so a failed call does not log "Task exception was never retrieved"
+    exc = task.exception()
+    if future.done():
+        return
+    if exc is not None:
+        future.set_exception(exc)
+    else:
+        future.set_result(task.result())
+
+
+def _bind_loop(state: _State, loop: asyncio.AbstractEventLoop) -> None:
+    """Pin state to loop, refusing to share it with a second running loop."""
+    if state.loop is not None:
+        if not state.loop.is_closed():
+            raise RuntimeError(
+                "throttled function is already bound to a different event loop"
+            )
+        # The previous loop is gone, along with its timers: start afresh so a
+        # call left pending there does not block this loop forever
+        state.args, state.kwargs, state.future = (), None, None
+        state.deadline = 0.0
+    state.loop = loop
+
+
+def _takes_no_arguments(func: Callable) -> bool:
+    """Return True if func can be determined to accept no arguments at all."""
+    try:
+        return not inspect.signature(func, follow_wrapped=False).parameters
+    except (TypeError, ValueError):
+        return False
+
+
+def throttle(wait: float, *, trailing: bool = True):
     """
-    Throttle decorator with both leading and trailing edge execution.
+    Throttle decorator with leading and (optionally) trailing edge execution.
     
-    All calls will eventually return their results. The first call executes 
-    immediately, while subsequent calls during the cooldown are delayed and 
-    executed when the cooldown period ends.
+    The first call executes immediately. Calls made during the cooldown go to a
+    single-slot mailbox: each one replaces the call already waiting there, and
+    only the call left in the mailbox when the cooldown ends is executed.
+    Replaced calls never run; they raise asyncio.CancelledError so they cannot
+    be mistaken for a call that returned None. A decorated function is bound
+    to the event loop it is first called on; calling it from another loop
+    raises RuntimeError until that first loop has been closed.
 
     Args:
         wait: The minimum time interval (in seconds) between allowed calls,
               measured from the start of the last allowed call.
+        trailing: If False, only leading edge calls are executed and every
+              call made during the cooldown raises asyncio.CancelledError.
     """
-    _can_run = True
-    _lock = asyncio.Lock()
-    _pending_call: Optional[Tuple[Tuple, Dict, asyncio.Future]] = None
+    # Normalise once so "loop.time() + wait" is always a float + float add
+    wait = float(wait)
 
     def decorator(func: Callable[..., Coroutine[Any, Any, T]]):
-        @functools.wraps(func)
-        async def wrapper(*args, **kwargs) -> T:
-            nonlocal _can_run, _pending_call
-            
-            # Create a Future for this call
-            future = asyncio.Future()
-            
-            async def _execute_func(a, kw, fut):
-                try:
-                    # Execute function and set result
-                    result = await func(*a, **kw)
-                    fut.set_result(result)
-                except Exception as e:
-                    # If exception occurs, set it as Future's exception
-                    fut.set_exception(e)
-            
-            async def _reset_can_run():
-                await asyncio.sleep(wait)
-                nonlocal _can_run, _pending_call
-                # Acquire lock to safely reset flags and handle pending calls
-                async with _lock:
-                    _can_run = True
-                    if _pending_call:
-                        # Get pending call
-                        args_to_run, kwargs_to_run, fut_to_set = _pending_call
-                        _pending_call = None
-                        # Set can't run immediately because we need to execute a call
-                        _can_run = False
-
-                # Execute pending function call outside the lock
-                if not _can_run:
-                    # Start a new reset task
-                    asyncio.create_task(_reset_can_run())
-                    # Execute function
-                    await _execute_func(args_to_run, kwargs_to_run, fut_to_set)
+        # State is pinned to the first event loop the function is called on.
+        # All transitions happen between awaits on that loop, so cooperative
+        # scheduling already makes them atomic; no lock is needed.
+        state = _State()
 
+        def _flush_pending():
+            # Get pending call
+            args_to_run, kwargs_to_run, fut_to_set = state.args, state.kwargs, state.future
+            state.args, state.kwargs, state.future = (), None, None
+            # Start a new cooldown period
+            state.deadline = state.loop.time() + wait
+            if fut_to_set.cancelled():
+                # Displaced calls always leave a fresh Future in the slot, so
+                # this caller gave up waiting: nobody wants the result
+                return
             try:
-                async with _lock:
-                    if not _can_run:
-                        # If there's already a pending call, set its result to None
-                        if _pending_call:
-                            _, _, old_future = _pending_call
-                            if not old_future.done():
-                                old_future.set_result(None)
-                        
-                        # Save current call as pending
-                        _pending_call = (args, kwargs, future)
-                    else:
-                        # Allow the call and immediately start cooldown timer
-                        _can_run = False
-                        # Start reset task in background
-                        asyncio.create_task(_reset_can_run())
-                        # Execute immediately
-                        asyncio.create_task(_execute_func(args, kwargs, future))
-                
+                coro = func(*args_to_run, **kwargs_to_run)
+            except Exception as exc:
+                # Calling func failed before producing a coroutine (e.g. bad
+                # arguments), report it to the caller instead of the loop
+                if not fut_to_set.done():
+                    fut_to_set.set_exception(exc)
+                return
+            # Run the function's own coroutine as a task and mirror its outcome
+            task = state.loop.create_task(coro)
+            task.add_done_callback(functools.partial(_copy_outcome, fut_to_set))
+
+        def _enqueue(loop, now, args, kwargs) -> asyncio.Future:
+            if not trailing:
+                # Leading edge only: discard calls made during the cooldown
+                raise asyncio.CancelledError()
+
+            # Create a Future for the trailing-edge call
+            future = loop.create_future()
+
+            old_future = state.future
+            if old_future is not None:
+                # If there's already a pending call, cancel it so its caller
+                # can tell a discarded call apart from a None result
+                old_future.cancel()
+            else:
+                # First call of this cooldown, schedule its dispatch
+                loop.call_later(state.deadline - now, _flush_pending)
+                state.deadline = _QUEUED
+
+            # Save current call as pending
+            state.args, state.kwargs, state.future = args, kwargs, future
+            return future
+
+        if _takes_no_arguments(func):
+            # Specialised wrapper that avoids building an empty kwargs dict on
+            # every call (CPython already shares a single empty args tuple)
+            @functools.wraps(func)
+            async def wrapper() -> T:
+                loop = asyncio.get_running_loop()
+                if loop is not state.loop:
+                    _bind_loop(state, loop)
+
+                now = loop.time()
+                if now >= state.deadline:
+                    state.deadline = now + wait
+                    return await func()
+
+                return await _enqueue(loop, now, (), {})
+        else:
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs) -> T:
+                loop = asyncio.get_running_loop()
+                if loop is not state.loop:
+                    _bind_loop(state, loop)
+
+                now = loop.time()
+                # A pending call pushes the deadline to infinity, so this single
+                # comparison covers both "cooldown elapsed" and "nothing queued"
+                if now >= state.deadline:
+                    # Cooldown has elapsed: start a new one and execute immediately,
+                    # no timer or intermediate Future is needed
+                    state.deadline = now + wait
+                    return await func(*args, **kwargs)
+
+                future = _enqueue(loop, now, args, kwargs)
+                # Drop this frame's references to the arguments so they are
+                # freed as soon as the dispatched call is done with them rather
+                # than when this caller resumes
+                del args, kwargs
+
                 # Return future, allowing caller to wait for result
                 return await future
-                
-            except Exception as e:
-                if not future.done():
-                    future.set_exception(e)
-                raise
-                
+
         return wrapper
     return decorator
@@ -1,4 +1,5 @@
 import asyncio
+import functools
 import time
 import pytest
 from pythrottle import throttle
@@ -26,11 +27,182 @@ async def test_throttle_functionality():
     results = await asyncio.gather(*tasks, return_exceptions=True)
     print(f"{time.monotonic():.2f}: Gather finished.")
     
-    print("--- Results (None indicates ignored call) ---")
+    print("--- Results (CancelledError indicates ignored call) ---")
     for i, res in enumerate(results):
         print(f"Task-{i}: {res}")
     
     # Basic assertions to verify behavior
     assert results[0] is not None  # First call should execute
-    assert None in results  # Some calls should be ignored
+    assert any(isinstance(r, asyncio.CancelledError) for r in results)  # Some calls should be ignored
     assert any(isinstance(r, str) and r.startswith("Result") for r in results)  # Some calls should return results
+
+@pytest.mark.asyncio
+async def test_throttle_runs_immediately_after_cooldown():
+    calls = []
+
+    @throttle(0.1)
+    async def record(name: str):
+        calls.append(name)
+        return name
+
+    async def sentinel():
+        calls.append("sentinel")
+
+    assert await record("first") == "first"
+    await asyncio.sleep(0.15)
+    # Cooldown has elapsed, so the call should run inline without yielding
+    # to the event loop, i.e. before the already scheduled sentinel task
+    sentinel_task = asyncio.create_task(sentinel())
+    assert await record("second") == "second"
+    await sentinel_task
+    assert calls == ["first", "second", "sentinel"]
+
+@pytest.mark.asyncio
+async def test_throttle_state_is_per_function():
+    limit = throttle(1.0)
+
+    @limit
+    async def first():
+        return "first"
+
+    @limit
+    async def second():
+        return "second"
+
+    # Each decorated function has its own cooldown
+    assert await first() == "first"
+    assert await asyncio.wait_for(second(), 0.1) == "second"
+
+def test_throttle_wraps():
+    async def documented():
+        """Docstring."""
+
+    wrapped = throttle(1.0)(documented)
+    assert wrapped.__wrapped__ is documented
+    assert wrapped.__name__ == "documented"
+    assert wrapped.__qualname__ == documented.__qualname__
+    assert wrapped.__module__ == documented.__module__
+    assert wrapped.__doc__ == "Docstring."
+
+    async def add(a, b):
+        return a + b
+
+    bound = functools.partial(add, 1)
+    partial_wrapper = throttle(1.0)(bound)
+    assert partial_wrapper.__wrapped__ is bound
+    assert asyncio.run(partial_wrapper(2)) == 3
+
+@pytest.mark.asyncio
+async def test_throttle_trailing_call_propagates_exception():
+    @throttle(0.1)
+    async def maybe_fail(fail: bool):
+        if fail:
+            raise ValueError("boom")
+        return "ok"
+
+    first = asyncio.create_task(maybe_fail(False))
+    await asyncio.sleep(0)
+    with pytest.raises(ValueError):
+        await maybe_fail(True)
+    assert await first == "ok"
+
+@pytest.mark.asyncio
+async def test_throttle_leading_only():
+    @throttle(0.1, trailing=False)
+    async def leading(name: str):
+        return name
+
+    assert await leading("first") == "first"
+    with pytest.raises(asyncio.CancelledError):
+        await leading("second")
+    await asyncio.sleep(0.15)
+    assert await leading("third") == "third"
+
+@pytest.mark.asyncio
+async def test_throttle_zero_argument_function():
+    calls = []
+
+    @throttle(0.1)
+    async def refresh():
+        calls.append(len(calls))
+        return len(calls)
+
+    first = asyncio.create_task(refresh())
+    second = asyncio.create_task(refresh())
+    third = asyncio.create_task(refresh())
+    assert await first == 1
+    with pytest.raises(asyncio.CancelledError):
+        await second
+    assert await third == 2
+    with pytest.raises(TypeError):
+        await refresh("unexpected")
+
+def test_throttle_rebinds_after_event_loop_closes():
+    @throttle(0.1)
+    async def ping():
+        return "pong"
+
+    async def ping_twice():
+        # Leave a trailing call pending when the loop shuts down
+        first = await ping()
+        asyncio.ensure_future(ping())
+        return first
+
+    assert asyncio.run(ping_twice()) == "pong"
+    assert asyncio.run(ping()) == "pong"
+
+
+def test_throttle_rejects_concurrent_event_loop():
+    @throttle(0.1)
+    async def ping():
+        return "pong"
+
+    first_loop = asyncio.new_event_loop()
+    try:
+        assert first_loop.run_until_complete(ping()) == "pong"
+        with pytest.raises(RuntimeError):
+            asyncio.run(ping())
+    finally:
+        first_loop.close()
+    assert asyncio.run(ping()) == "pong"
+
+@pytest.mark.asyncio
+async def test_throttle_trailing_call_with_bad_arguments():
+    @throttle(0.1)
+    async def one(value):
+        return value
+
+    assert await one(1) == 1
+    with pytest.raises(TypeError):
+        await asyncio.wait_for(one(), 1)
+
+@pytest.mark.asyncio
+async def test_throttle_wrapped_zero_argument_function():
+    async def refresh():
+        return "refreshed"
+
+    @functools.wraps(refresh)
+    async def with_timeout(*args, timeout=None, **kwargs):
+        return await asyncio.wait_for(refresh(*args, **kwargs), timeout)
+
+    throttled = throttle(0.1)(with_timeout)
+    # The outer signature accepts arguments even though refresh does not
+    assert await throttled(timeout=1) == "refreshed"
+
+@pytest.mark.asyncio
+async def test_throttle_skips_trailing_call_after_caller_gives_up():
+    ran = []
+
+    @throttle(0.1)
+    async def record(value):
+        ran.append(value)
+        return value
+
+    assert await record(1) == 1
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(record(2), 0.01)
+    await asyncio.sleep(0.15)
+    assert ran == [1]
+    # The cooldown still restarted when the abandoned call was dropped
+    assert await record(3) == 3
+    assert ran == [1, 3]